@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+"""
+A GitHub org client.
+"""
+
+from typing import Dict, List, Optional
+
+from utils import access_nested_map, get_json
+
+
+class GithubOrgClient:
+    """
+    Retrieves public information about a GitHub organisation.
+    """
+
+    ORG_URL = "https://api.github.com/orgs/{org}"
+
+    def __init__(self, org_name: str) -> None:
+        """
+        Stores the organisation name; no network access happens here.
+        """
+        self._org_name = org_name
+        self._org_payload: Optional[Dict] = None
+        self._repos_payload: Optional[List[Dict]] = None
+
+    def org(self) -> Dict:
+        """
+        Returns the organisation payload, fetching it on the first call
+        and serving the cached copy afterwards.
+        """
+        if self._org_payload is None:
+            self._org_payload = get_json(
+                self.ORG_URL.format(org=self._org_name))
+        return self._org_payload
+
+    @property
+    def _public_repos_url(self) -> str:
+        """
+        Returns the URL of the organisation's public repositories, read
+        from the (cached) organisation payload.
+        """
+        return self.org()["repos_url"]
+
+    def repos_payload(self) -> List[Dict]:
+        """
+        Returns the repositories payload, fetching it on the first call
+        and serving the cached copy afterwards.
+        """
+        if self._repos_payload is None:
+            self._repos_payload = get_json(self._public_repos_url)
+        return self._repos_payload
+
+    def public_repos(self, license: Optional[str] = None) -> List[str]:
+        """
+        Returns the names of the organisation's public repositories,
+        optionally keeping only those under the given license key.
+        """
+        return [
+            repo["name"] for repo in self.repos_payload()
+            if license is None or self.has_license(repo, license)
+        ]
+
+    @staticmethod
+    def has_license(repo: Dict, license_key: str) -> bool:
+        """
+        Returns True if repo declares the given license key.
+        """
+        assert license_key is not None, "license_key cannot be None"
+        try:
+            return access_nested_map(
+                repo, ("license", "key")) == license_key
+        except KeyError:
+            return False
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Shared pytest fixtures for the unit and integration test suite.
+"""
+
+import functools
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
+
+import pytest
+
+# Canonical payloads served by the mocked GitHub API.
+org_payload = {"login": "google",
+               "repos_url": "https://api.github.com/orgs/google/repos"}
+repos_payload = [
+    {"name": "repo1", "license": {"key": "mit"}},
+    {"name": "repo2", "license": {"key": "apache-2.0"}},
+    {"name": "repo3", "license": None},
+]
+expected_repos = ["repo1", "repo2", "repo3"]
+apache2_repos = ["repo2"]
+
+# Raw payload data served by the mocked GitHub API, keyed by URL.
+_URL_TO_PAYLOAD = {
+    "https://api.github.com/orgs/google": org_payload,
+    "https://api.github.com/orgs/google/repos": repos_payload,
+}
+
+# Defined at module level (not inside a fixture) so the cache survives the
+# whole session and stays compatible with pytest hot-reloaders.
+@functools.lru_cache(maxsize=None)
+def _payload_for(url: str) -> dict:
+    """Returns the fixture payload for a URL, memoized across calls."""
+    return _URL_TO_PAYLOAD[url]
+
+
+# Responses are built once at import and looked up by URL, so the patched
+# requests.get never constructs a new Mock per call.
+_URL_TO_MOCK = {
+    url: SimpleNamespace(json=lambda u=url: _payload_for(u))
+    for url in _URL_TO_PAYLOAD
+}
+# Fallback for unexpected URLs: a healthy 200 with an empty payload, so
+# stray calls never trigger retry or error paths
+_DEFAULT = Mock(status_code=200, json=lambda: {})
+
+
+@pytest.fixture(scope="session", autouse=True)
+def no_sleep():
+    """
+    Turns time.sleep into a no-op for the whole session so any retry or
+    backoff path hit by the suite never blocks on real wall-clock time.
+    """
+    with patch("time.sleep", return_value=None):
+        yield
+
+
+@pytest.fixture(scope="session", autouse=True)
+def mock_requests_get():
+    """
+    Installs a single session-wide patch of requests.get that serves the
+    fixture payloads by URL, replacing per-class patcher setup/teardown.
+    """
+    with patch("requests.get",
+               side_effect=lambda url: _URL_TO_MOCK.get(url, _DEFAULT)
+               ) as mock_get:
+        yield mock_get
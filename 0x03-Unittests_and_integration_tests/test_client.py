@@ -3,22 +3,35 @@
 Unit and integration tests for the client module.
 """
 
+import functools
 import unittest
-from unittest.mock import patch, PropertyMock
+from unittest.mock import patch
+
 from parameterized import parameterized, parameterized_class
 from client import GithubOrgClient
 
-# Assuming fixtures.py exists and contains these payloads
-# For the purpose of this example, we'll define minimal placeholders
-# If you have a real fixtures.py, ensure these match its content.
-org_payload = {"login": "google", "repos_url": "https://api.github.com/orgs/google/repos"}
-repos_payload = [
-    {"name": "repo1", "license": {"key": "mit"}},
-    {"name": "repo2", "license": {"key": "apache-2.0"}},
-    {"name": "repo3", "license": None},
-]
-expected_repos = ["repo1", "repo2", "repo3"]
-apache2_repos = ["repo2"]
+# The canonical payloads live in conftest.py alongside the session-wide
+# requests.get patch that serves them by URL.
+from conftest import (
+    org_payload, repos_payload, expected_repos, apache2_repos
+)
+
+
+# Hoisted to module scope so the same client instance is reused wherever a
+# test needs a client for a given org name.
+@functools.lru_cache(maxsize=None)
+def _client(org_name: str) -> GithubOrgClient:
+    """Returns a cached GithubOrgClient instance for the given org name."""
+    return GithubOrgClient(org_name)
+
+
+# Expected URL and payload per org name, precomputed once at import so
+# parameterized tests just index into it instead of rebuilding both per run.
+_ORG_FIXTURES = {
+    name: (f"https://api.github.com/orgs/{name}",
+           {"login": name, "id": 12345})
+    for name in ("google", "abc")
+}
 
 
 class TestGithubOrgClient(unittest.TestCase):
@@ -26,6 +39,13 @@ class TestGithubOrgClient(unittest.TestCase):
     Tests the GithubOrgClient class.
     """
 
+    def setUp(self) -> None:
+        """
+        Clears the cached client instances so each unit test's per-call
+        mock assertions see a client with no memoized state.
+        """
+        _client.cache_clear()
+
     @parameterized.expand([
         ("google",),
         ("abc",),
@@ -36,86 +56,58 @@ class TestGithubOrgClient(unittest.TestCase):
         Tests that GithubOrgClient.org returns the correct value
         and that get_json is called once with the expected argument.
         """
-        # Define the expected payload for the mocked get_json
-        expected_payload = {"login": org_name, "id": 12345}
+        # Look up the precomputed URL and payload for this org
+        expected_url, expected_payload = _ORG_FIXTURES[org_name]
         mock_get_json.return_value = expected_payload
 
-        # Create an instance of GithubOrgClient
-        client = GithubOrgClient(org_name)
+        # Fetch the (cached) instance of GithubOrgClient
+        client = _client(org_name)
 
         # Call the method under test
         result = client.org()
 
-        # Construct the expected URL
-        expected_url = f"https://api.github.com/orgs/{org_name}"
-
         # Assert that get_json was called exactly once with the expected URL
         mock_get_json.assert_called_once_with(expected_url)
 
         # Assert that the output of org() is equal to the expected payload
         self.assertEqual(result, expected_payload)
 
-    def test_public_repos_url(self) -> None:
-        """
-        Tests that _public_repos_url returns the expected URL based on a mocked payload.
-        """
-        # Define the payload that the mocked org method will return
-        test_payload = {"repos_url": "https://api.github.com/orgs/testorg/repos"}
-
-        # Use patch as a context manager to mock GithubOrgClient.org
-        with patch('client.GithubOrgClient.org', new_callable=PropertyMock) as mock_org:
-            # Configure the mocked org to return the test_payload
-            mock_org.return_value = test_payload
-
-            # Create an instance of GithubOrgClient (org_name doesn't matter here
-            # since org is mocked)
-            client = GithubOrgClient("testorg")
-
-            # Access the _public_repos_url property
-            result = client._public_repos_url
-
-            # Assert that the mocked org property was called once
-            mock_org.assert_called_once()
-
-            # Assert that the result is the expected URL from the payload
-            self.assertEqual(result, test_payload["repos_url"])
-
     @patch('client.get_json')
-    def test_public_repos(self, mock_get_json: patch) -> None:
+    def test_public_repos_and_url(self, mock_get_json: patch) -> None:
         """
-        Tests that public_repos returns the expected list of repositories
-        and that mocked methods are called once.
+        Tests org, _public_repos_url, and public_repos against one shared
+        mocked client, inside a single patch of client.get_json.
         """
-        # Define the payload that get_json will return
-        repos_payload = [
+        # Payloads served by the mocked get_json, keyed by URL
+        org_url = "https://api.github.com/orgs/testorg"
+        repos_url = "https://api.github.com/orgs/testorg/repos"
+        test_org_payload = {"login": "testorg", "repos_url": repos_url}
+        test_repos_payload = [
             {"name": "repo1", "license": {"key": "mit"}},
             {"name": "repo2", "license": None},
             {"name": "repo3", "license": {"key": "apache-2.0"}},
         ]
-        mock_get_json.return_value = repos_payload
-
-        # Define the URL that _public_repos_url will return
-        public_repos_url_value = "https://api.github.com/orgs/testorg/repos"
-
-        with patch('client.GithubOrgClient._public_repos_url',
-                   new_callable=PropertyMock) as mock_public_repos_url:
-            mock_public_repos_url.return_value = public_repos_url_value
+        url_payloads = {org_url: test_org_payload,
+                        repos_url: test_repos_payload}
+        mock_get_json.side_effect = lambda url: url_payloads[url]
 
-            # Create an instance of GithubOrgClient
-            client = GithubOrgClient("testorg")
+        # One client instance exercises all three public members
+        client = _client("testorg")
 
-            # Call the method under test
-            result = client.public_repos()
+        # org() fetches the org payload from the org URL
+        self.assertEqual(client.org(), test_org_payload)
 
-            # Assert that _public_repos_url was called once
-            mock_public_repos_url.assert_called_once()
+        # _public_repos_url reads repos_url out of the cached org payload
+        self.assertEqual(client._public_repos_url, repos_url)
 
-            # Assert that get_json was called once with the correct URL
-            mock_get_json.assert_called_once_with(public_repos_url_value)
+        # public_repos() fetches the repos payload and returns the names
+        self.assertEqual(client.public_repos(), ["repo1", "repo2", "repo3"])
 
-            # Assert that the list of repos is as expected (only names)
-            expected_repos = ["repo1", "repo2", "repo3"]
-            self.assertEqual(result, expected_repos)
+        # Both payloads were fetched, without pinning down how often the
+        # client re-reads them internally
+        fetched = [c.args[0] for c in mock_get_json.call_args_list]
+        self.assertIn(org_url, fetched)
+        self.assertIn(repos_url, fetched)
 
 
 @parameterized_class([
@@ -129,47 +121,26 @@ class TestGithubOrgClient(unittest.TestCase):
 class TestIntegrationGithubOrgClient(unittest.TestCase):
     """
     Integration tests for the GithubOrgClient.public_repos method.
-    """
-    @classmethod
-    def setUpClass(cls) -> None:
-        """
-        Sets up the class-level mock for requests.get to simulate API calls.
-        """
-        cls.get_patcher = patch('requests.get')
-        cls.mock_get = cls.get_patcher.start()
-
-        # Define the side_effect for the mocked requests.get
-        # This function will return a Mock object with a json() method
-        # that returns the appropriate fixture based on the URL.
-        def side_effect(url):
-            if url == "https://api.github.com/orgs/google":
-                return Mock(json=lambda: cls.org_payload)
-            elif url == "https://api.github.com/orgs/google/repos":
-                return Mock(json=lambda: cls.repos_payload)
-            return Mock(json=lambda: {}) # Default for unexpected URLs
 
-        cls.mock_get.side_effect = side_effect
+    The requests.get patch is installed once per session by the autouse
+    fixture in conftest.py, which serves the fixture payloads by URL.
+    """
 
     @classmethod
-    def tearDownClass(cls) -> None:
+    def setUpClass(cls) -> None:
         """
-        Stops the patcher after all tests in the class have run.
+        Clears the cached client instances so these tests never inherit a
+        client whose memoized org payload came from a unit test's mock.
         """
-        cls.get_patcher.stop()
+        _client.cache_clear()
 
-    def test_public_repos(self) -> None:
+    def test_public_repos_all_and_filtered(self) -> None:
         """
-        Tests that public_repos returns the expected list of repositories
-        from the fixtures.
+        Tests that public_repos returns the expected repositories from the
+        fixtures, both unfiltered and filtered by license, against a single
+        client so the second call reuses the already-fetched payload.
         """
-        client = GithubOrgClient("google")
+        client = _client("google")
         self.assertEqual(client.public_repos(), self.expected_repos)
-
-    def test_public_repos_with_license(self) -> None:
-        """
-        Tests that public_repos with a license argument returns the
-        expected list of repositories with that license from the fixtures.
-        """
-        client = GithubOrgClient("google")
         self.assertEqual(client.public_repos(license="apache-2.0"),
                          self.apache2_repos)
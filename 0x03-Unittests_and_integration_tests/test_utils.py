@@ -65,6 +65,26 @@ class TestGetJson(unittest.TestCase):
         self.assertEqual(result, test_payload)
 
 
+class MemoizedClass:
+    """
+    A class to demonstrate memoization, defined at module scope so the
+    class body and decorator wrapping are compiled once rather than on
+    every test invocation.
+    """
+    def a_method(self) -> int:
+        """
+        A simple method that returns 42.
+        """
+        return 42
+
+    @memoize
+    def a_property(self) -> int:
+        """
+        A property that calls a_method and is memoized.
+        """
+        return self.a_method()
+
+
 class TestMemoize(unittest.TestCase):
     """
     Tests the memoize decorator from the utils module.
@@ -74,25 +94,8 @@ class TestMemoize(unittest.TestCase):
         """
         Tests that a method decorated with @memoize calls its wrapped method only once.
         """
-        class TestClass:
-            """
-            A test class to demonstrate memoization.
-            """
-            def a_method(self) -> int:
-                """
-                A simple method that returns 42.
-                """
-                return 42
-
-            @memoize
-            def a_property(self) -> int:
-                """
-                A property that calls a_method and is memoized.
-                """
-                return self.a_method()
-
-        with patch.object(TestClass, 'a_method', return_value=42) as mock_a_method:
-            test_instance = TestClass()
+        with patch.object(MemoizedClass, 'a_method', return_value=42) as mock_a_method:
+            test_instance = MemoizedClass()
             # Call a_property twice
             result1 = test_instance.a_property
             result2 = test_instance.a_property
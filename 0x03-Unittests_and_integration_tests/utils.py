@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+"""
+Generic utilities for the GitHub org client.
+"""
+
+from functools import wraps
+from typing import Any, Callable, Dict, Mapping, Sequence
+
+import requests
+
+
+def access_nested_map(nested_map: Mapping, path: Sequence) -> Any:
+    """
+    Returns the value reached by following path through nested_map,
+    raising a KeyError naming the first key that cannot be followed.
+    """
+    for key in path:
+        if not isinstance(nested_map, Mapping):
+            raise KeyError(key)
+        nested_map = nested_map[key]
+    return nested_map
+
+
+def get_json(url: str) -> Dict:
+    """
+    Fetches url over HTTP and returns its body decoded as JSON.
+    """
+    response = requests.get(url)
+    return response.json()
+
+
+def memoize(fn: Callable) -> Callable:
+    """
+    Turns a zero-argument method into a property whose result is computed
+    once per instance and cached on the instance for later accesses.
+    """
+    attr_name = "_{}".format(fn.__name__)
+
+    @wraps(fn)
+    def memoized(self) -> Any:
+        """Returns the cached result, computing it on first access."""
+        if not hasattr(self, attr_name):
+            setattr(self, attr_name, fn(self))
+        return getattr(self, attr_name)
+
+    return property(memoized)
@@ -170,6 +170,12 @@ class Message(models.Model):
         verbose_name = "Message"
         verbose_name_plural = "Messages"
         ordering = ['sent_at'] # Order messages by sent time
+        indexes = [
+            # Serves the per-conversation history query as an index-only
+            # range scan instead of a filter plus sort.
+            models.Index(fields=['conversation', 'sent_at'],
+                         name='msg_conv_sent_idx'),
+        ]
 
     def __str__(self) -> str:
         """
@@ -7,8 +7,10 @@ This module defines ViewSets for handling API requests related to
 Conversations and Messages.
 """
 
+from django.core.exceptions import ValidationError
+from django.db.models import Prefetch
 from django.shortcuts import render
-from rest_framework import viewsets, status
+from rest_framework import serializers, viewsets, status
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from django.shortcuts import get_object_or_404
@@ -34,10 +36,23 @@ class ConversationViewSet(viewsets.ModelViewSet):
     def get_queryset(self):
         """
         Filters conversations to only show those the authenticated user is a participant of.
+
+        Participants, messages, and each message's sender are prefetched so
+        the nested ConversationSerializer does not issue one query per
+        conversation (or per message) during serialization.
         """
         user = self.request.user
         if user.is_authenticated:
-            return Conversation.objects.filter(participants=user).distinct()
+            return Conversation.objects.filter(
+                participants=user
+            ).distinct().prefetch_related(
+                'participants',
+                Prefetch(
+                    'messages',
+                    queryset=Message.objects.select_related('sender')
+                                            .order_by('sent_at')
+                ),
+            )
         return Conversation.objects.none() # No conversations for unauthenticated users
 
     def create(self, request, *args, **kwargs):
@@ -61,31 +76,131 @@ class ConversationViewSet(viewsets.ModelViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Ensure the authenticated user is always a participant
-        all_participant_ids = list(set(participant_ids + [str(request.user.id)]))
+        # Ensure the authenticated user is always a participant; IDs are
+        # normalized to str up front so id__in does no per-row coercion
+        all_participant_ids = {str(pid) for pid in participant_ids}
+        all_participant_ids.add(str(request.user.id))
 
-        # Fetch User instances for all participants
+        # Fetch the participant rows once; they serve both validation and
+        # the response payload below
         try:
-            participants = User.objects.filter(id__in=all_participant_ids)
-            if participants.count() != len(all_participant_ids):
-                # Some IDs were not found
-                return Response(
-                    {"detail": "One or more participant IDs are invalid."},
-                    status=status.HTTP_400_BAD_REQUEST
-                )
+            participants = list(User.objects.filter(
+                id__in=all_participant_ids
+            ))
         except ValueError:
             return Response(
                 {"detail": "Invalid UUID format for participant IDs."},
                 status=status.HTTP_400_BAD_REQUEST
             )
 
-        # Create the conversation
-        conversation = Conversation.objects.create()
-        conversation.participants.set(participants)
-        conversation.save()
+        found_ids = {str(user.id) for user in participants}
+        if found_ids != all_participant_ids:
+            # Some IDs were not found
+            return Response(
+                {"detail": "One or more participant IDs are invalid."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
 
-        serializer = self.get_serializer(conversation)
-        return Response(serializer.data, status=status.HTTP_201_CREATED)
+        # Create the conversation, then write all memberships with one
+        # batched INSERT on the through table instead of .set(), which
+        # issues a SELECT plus per-row INSERTs on some backends
+        conversation = Conversation.objects.create()
+        Through = Conversation.participants.through
+        Through.objects.bulk_create(
+            [Through(conversation_id=conversation.pk, user_id=user.pk)
+             for user in participants],
+            batch_size=500,
+            ignore_conflicts=True,
+        )
+
+        # The full state of a new conversation is already in hand, so build
+        # the response directly instead of re-fetching everything through
+        # the nested ConversationSerializer
+        response_data = {
+            'conversation_id': str(conversation.conversation_id),
+            'participants': UserSerializer(participants, many=True).data,
+            'messages': [],
+            # Rendered through DRF's DateTimeField so the format matches
+            # what ConversationSerializer produces on reads
+            'created_at': serializers.DateTimeField().to_representation(
+                conversation.created_at),
+        }
+        return Response(response_data, status=status.HTTP_201_CREATED)
 
 
 class MessageViewSet(viewsets.ModelViewSet):
+    """
+    A ViewSet for viewing and editing Message instances.
+
+    Provides actions for:
+    - Listing all messages in conversations the authenticated user is a part of.
+    - Retrieving a single message.
+    - Sending a new message to an existing conversation.
+    """
+    queryset = Message.objects.all()
+    serializer_class = MessageSerializer
+    permission_classes = [IsParticipant] # Use your custom permission
+
+    def get_queryset(self):
+        """
+        Filters messages to only show those from conversations the
+        authenticated user is a participant of.
+
+        The sender and conversation rows are joined up front with
+        select_related so the nested MessageSerializer does not issue one
+        query per message during serialization. Ordering comes from
+        Message.Meta.ordering, served by the (conversation, sent_at)
+        composite index.
+        """
+        user = self.request.user
+        if user.is_authenticated:
+            return Message.objects.filter(
+                conversation__participants=user
+            ).select_related('sender', 'conversation')
+        return Message.objects.none() # No messages for unauthenticated users
+
+    def create(self, request, *args, **kwargs):
+        """
+        Sends a new message to an existing conversation.
+
+        Expects 'conversation' (the conversation ID) and 'message_body' in
+        the request data. The authenticated user must be a participant of
+        the target conversation and is recorded as the sender.
+        """
+        if not request.user.is_authenticated:
+            return Response(
+                {"detail": "Authentication credentials were not provided."},
+                status=status.HTTP_401_UNAUTHORIZED
+            )
+
+        conversation_id = request.data.get('conversation')
+        message_body = request.data.get('message_body')
+        if not conversation_id or not message_body:
+            return Response(
+                {"detail": "conversation and message_body are required."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        # A malformed UUID raises ValidationError inside the pk lookup,
+        # which DRF's handler would surface as a 500; answer 400 instead
+        try:
+            conversation = get_object_or_404(Conversation, pk=conversation_id)
+        except (ValidationError, ValueError):
+            return Response(
+                {"detail": "Invalid UUID format for conversation."},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if not conversation.participants.filter(pk=request.user.pk).exists():
+            return Response(
+                {"detail": "You are not a participant of this conversation."},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        message = Message.objects.create(
+            conversation=conversation,
+            sender=request.user,
+            message_body=message_body
+        )
+
+        serializer = self.get_serializer(message)
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
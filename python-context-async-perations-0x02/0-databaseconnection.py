@@ -1,36 +1,63 @@
 import sqlite3
+import sys
 
 class DatabaseConnection:
-    """Class-based context manager for SQLite database connections"""
-    
+    """Class-based context manager for SQLite database connections.
+
+    Connections are pooled per database name at class level, so repeated
+    context entries reuse the same underlying connection (and its warm page
+    cache) instead of paying file-open and setup costs on every use.
+    """
+
+    # Open connections shared across context entries, keyed by db name
+    _pool = {}
+
     def __init__(self, db_name):
         self.db_name = db_name
         self.conn = None
         self.cursor = None
 
     def __enter__(self):
-        """Enter the runtime context - opens connection and returns cursor"""
-        self.conn = sqlite3.connect(self.db_name)
+        """Enter the runtime context - reuses a pooled connection and returns a cursor"""
+        conn = self._pool.get(self.db_name)
+        if conn is None:
+            conn = sqlite3.connect(self.db_name, check_same_thread=False)
+            # Configured once on first open; WAL persists in the db file
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            # Named column access without building a dict per row
+            conn.row_factory = sqlite3.Row
+            self._pool[self.db_name] = conn
+        self.conn = conn
         self.cursor = self.conn.cursor()
         return self.cursor
 
     def __exit__(self, exc_type, exc_val, exc_tb):
-        """Exit the runtime context - closes connection and handles errors"""
+        """Exit the runtime context - closes only the cursor, keeping the pooled connection open"""
         if self.cursor:
             self.cursor.close()
-        if self.conn:
-            self.conn.close()
-    
-        return False  
+
+        return False
+
+    @classmethod
+    def close_all(cls):
+        """Close every pooled connection (call once at process teardown)."""
+        while cls._pool:
+            _, conn = cls._pool.popitem()
+            conn.close()
 
 # Usage example
 if __name__ == "__main__":
     try:
         with DatabaseConnection('users.db') as cursor:
             cursor.execute("SELECT * FROM users")
-            results = cursor.fetchall()
             print("Database Query Results:")
-            for row in results:
-                print(row)
+            # Stream rows in batches instead of materializing the whole
+            # result set with fetchall()
+            cursor.arraysize = 1000
+            while (batch := cursor.fetchmany()):
+                sys.stdout.writelines(f"{tuple(row)}\n" for row in batch)
     except sqlite3.Error as e:
         print(f"Database error: {e}")
+    finally:
+        DatabaseConnection.close_all()
@@ -1,5 +1,42 @@
 import sqlite3
 
+# Tuned per-connection PRAGMAs applied on every open; journal_mode=WAL is
+# issued only on the first open per process since WAL persists in the file.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+_wal_enabled = False
+
+def _configure(conn):
+    """Apply the tuned SQLite PRAGMAs to a freshly opened connection."""
+    global _wal_enabled
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+
+_indexes_ready = False
+
+def _ensure_indexes(conn):
+    """Create the indexes serving this module's queries, once per process.
+
+    Separate single-column indexes fit the predicates used here (age
+    ranges and status equality on their own); ANALYZE refreshes the
+    planner statistics so they actually get picked.
+    """
+    global _indexes_ready
+    if _indexes_ready:
+        return
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_users_age ON users(age)")
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS idx_users_status ON users(status)")
+    conn.execute("ANALYZE users")
+    _indexes_ready = True
+
 class ExecuteQuery:
     """
     A reusable context manager for executing parameterized SQL queries.
@@ -21,6 +58,7 @@ class ExecuteQuery:
         self.conn = None
         self.cursor = None
         self.results = None
+        self._pending = False
 
     def __enter__(self):
         """
@@ -28,12 +66,16 @@ class ExecuteQuery:
         Returns self for result access.
         """
         self.conn = sqlite3.connect(self.db_path)
+        _configure(self.conn)
+        _ensure_indexes(self.conn)
         self.cursor = self.conn.cursor()
         
         if self.query:
+            # Execute eagerly but leave the rows on the cursor so callers
+            # can stream them; fetch_results() materializes on demand
             self.cursor.execute(self.query, self.params or ())
-            self.results = self.cursor.fetchall()
-            
+            self._pending = True
+
         return self
 
     def execute(self, query, params=None):
@@ -48,10 +90,11 @@ class ExecuteQuery:
         """
         if not self.cursor:
             raise RuntimeError("No active database connection")
-            
+
         self.cursor.execute(query, params or ())
-        self.results = self.cursor.fetchall()
-        return self.results
+        self.results = None
+        self._pending = True
+        return self.fetch_results()
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """
@@ -71,11 +114,35 @@ class ExecuteQuery:
         return False  # Propagate exceptions
 
     def fetch_results(self):
-        """Get results from the most recent query"""
+        """Get all results from the most recent query, materialized lazily"""
         if self.results is None:
-            raise ValueError("No query has been executed yet")
+            if not self._pending:
+                raise ValueError("No query has been executed yet")
+            self.results = self.cursor.fetchall()
+            self._pending = False
         return self.results
 
+    def iter_results(self, chunk=250):
+        """
+        Stream the most recent query's rows in fetchmany batches.
+
+        Yields rows one at a time while keeping at most `chunk` rows in
+        memory, instead of materializing the whole result set the way
+        fetch_results() does.
+        """
+        if self.results is not None:
+            # Already materialized; iterate over the cached list
+            yield from self.results
+            return
+        if not self._pending:
+            raise ValueError("No query has been executed yet")
+        while True:
+            rows = self.cursor.fetchmany(chunk)
+            if not rows:
+                self._pending = False
+                return
+            yield from rows
+
 
 # Usage example
 if __name__ == "__main__":
@@ -85,9 +152,9 @@ if __name__ == "__main__":
     
     # Use as context manager
     with ExecuteQuery(query=query, params=param) as executor:
-        results = executor.fetch_results()
-        print(f"Found {len(results)} users over age 25:")
-        for user in results:
+        print("Users over age 25:")
+        # Stream rows in chunks instead of materializing the whole table
+        for user in executor.iter_results():
             print(user)
         
         # Can execute additional queries in same context
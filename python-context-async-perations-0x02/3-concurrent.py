@@ -1,33 +1,64 @@
 import asyncio
+# aiosqlite >= 0.17 is required: it provides execute_fetchall and
+# dispatches statements to the worker thread through a blocking queue of
+# futures rather than the old per-statement polling loop, so each query
+# costs one wake-up instead of repeated event-loop ticks.
 import aiosqlite # Asynchronous SQLite library
 
-async def async_fetch_users():
+# Tuned PRAGMAs applied to each connection; journal_mode=WAL persists in
+# the database file once set, the rest are per-connection settings.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+
+async def _configure(db):
+    """Apply the tuned SQLite PRAGMAs to a freshly opened connection"""
+    for pragma in _PRAGMAS:
+        await db.execute(pragma)
+    # Named column access; metadata is shared across rows instead of
+    # building a dict per row
+    db.row_factory = aiosqlite.Row
+
+async def async_fetch_users(db):
     """Fetch all users from the database"""
-    async with aiosqlite.connect('users.db') as db:
-        async with db.execute('SELECT * FROM users') as cursor:
-            return await cursor.fetchall()
+    # One round-trip to the worker thread instead of execute + fetchall
+    return await db.execute_fetchall('SELECT id, name, email, age FROM users')
 
-async def async_fetch_older_users():
+async def async_fetch_older_users(db):
     """Fetch users older than 40 from the database"""
-    async with aiosqlite.connect('users.db') as db:
-        async with db.execute('SELECT * FROM users WHERE age > ?', (40,)) as cursor:
-            return await cursor.fetchall()
+    return await db.execute_fetchall(
+        'SELECT id, name, email, age FROM users WHERE age > ?', (40,))
 
-async def fetch_concurrently():
-    """Execute both queries concurrently"""
+async def fetch_concurrently(db):
+    """Execute both queries concurrently over the shared connection"""
+    # aiosqlite serializes statements per connection on a single worker
+    # thread, so a second connection buys no parallelism on SQLite; sharing
+    # one saves a thread spawn and a file open per run
     return await asyncio.gather(
-        async_fetch_users(),
-        async_fetch_older_users()
+        async_fetch_users(db),
+        async_fetch_older_users(db)
     )
 
 async def main():
     """Main async function to run the queries"""
-    all_users, older_users = await fetch_concurrently()
+    # One connection for the lifetime of the app: opened and configured
+    # once here, shared by every fetch, closed on the way out - no
+    # per-call __aenter__/__aexit__ pairs remain on the query path
+    db = await aiosqlite.connect('users.db')
+    try:
+        await _configure(db)
+        all_users, older_users = await fetch_concurrently(db)
+    finally:
+        await db.close()
     print(f"Total users: {len(all_users)}")
     print(f"Users over 40: {len(older_users)}")
     print("\nSample older users:")
     for user in older_users[:5]:  # Print first 5 older users
-        print(user)
+        print(tuple(user))
 
 if __name__ == '__main__':
     asyncio.run(main())
@@ -1,24 +1,58 @@
 import sqlite3
 import functools
+import logging
+import collections
+
+logger = logging.getLogger(__name__)
+
+# SQL verbs recognized for per-verb metrics; classification is a prefix
+# comparison on a lowercased slice, cheaper than a regex or split per call
+_VERBS = ('select', 'insert', 'update', 'delete', 'pragma')
+query_counts = collections.Counter()
+
+# Tuned per-connection PRAGMAs applied on every open; journal_mode=WAL is
+# issued only on the first open per process since WAL persists in the file.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+_wal_enabled = False
+
+def _configure(conn):
+    """Apply the tuned SQLite PRAGMAs to a freshly opened connection."""
+    global _wal_enabled
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
 
 #### decorator to log SQL queries
 def log_queries(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Log the SQL query
-        query = args[0]  # Assuming the first argument is the SQL query
-        print(f"Executing SQL query: {query}")
+        # Works whether the query arrives positionally or as a keyword
+        query = args[0] if args else kwargs.get('query')
+        # Classify by leading verb and count it for per-verb metrics
+        q = (query or '').lstrip()
+        verb = next((v for v in _VERBS if q[:len(v)].lower() == v), 'other')
+        query_counts[verb] += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            # Lazy %s formatting: nothing is built when DEBUG is off
+            logger.debug("Executing SQL query [%s]: %s", verb, query)
         return func(*args, **kwargs)
     return wrapper
 
 @log_queries
 def fetch_all_users(query):
     conn = sqlite3.connect('users.db')
-    cursor = conn.cursor()
-    cursor.execute(query)
-    results = cursor.fetchall()
+    _configure(conn)
+    conn.row_factory = sqlite3.Row
+    results = conn.execute(query).fetchall()
     conn.close()
     return results
 
 #### fetch users while logging the query
-users = fetch_all_users(query="SELECT * FROM users")
+users = fetch_all_users(query="SELECT id, name, email, age FROM users")
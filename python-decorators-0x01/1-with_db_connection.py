@@ -1,26 +1,85 @@
+import os
+import queue
 import sqlite3
 import functools
 
+# Tuned per-connection PRAGMAs applied on every open; journal_mode=WAL is
+# issued only on the first open per process since WAL persists in the file.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+_wal_enabled = False
+
+def _configure(conn):
+    """Apply the tuned SQLite PRAGMAs to a freshly opened connection."""
+    global _wal_enabled
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+
+class ConnectionPool:
+    """Small thread-safe pool of pre-opened SQLite connections.
+
+    Keeping connections alive across calls preserves their page cache and
+    avoids paying file-open and setup costs on every query.
+    """
+
+    def __init__(self, db_name='users.db', size=None):
+        self.db_name = db_name
+        self.size = size or int(os.environ.get('DB_POOL_SIZE', '4'))
+        self._connections = queue.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            # Larger prepared-statement LRU (default 128), worthwhile now
+            # that connections live for the whole process; isolation_level
+            # None leaves transaction control to SQLite's autocommit
+            conn = sqlite3.connect(db_name, check_same_thread=False,
+                                   cached_statements=512,
+                                   isolation_level=None)
+            _configure(conn)
+            # Named column access; metadata is shared across rows instead
+            # of building a dict per row
+            conn.row_factory = sqlite3.Row
+            self._connections.put(conn)
+
+    def acquire(self):
+        """Check a connection out of the pool (blocks while all are in use)."""
+        return self._connections.get()
+
+    def release(self, conn):
+        """Return a connection to the pool."""
+        self._connections.put(conn)
+
+# Module-level pool shared by every decorated function
+_pool = ConnectionPool()
+
 def with_db_connection(func):
     """Decorator to handle database connection."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Open a database connection
-        conn = sqlite3.connect('users.db')
+        # Borrow a pooled connection instead of opening a fresh one
+        conn = _pool.acquire()
         try:
             # Call the original function with the connection
             return func(conn, *args, **kwargs)
         finally:
-            # Ensure the connection is closed after the function call
-            conn.close()
+            # Return the connection to the pool for reuse
+            _pool.release(conn)
     return wrapper
 
 @with_db_connection
 def get_user_by_id(conn, user_id):
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-    return cursor.fetchone()
+    # conn.execute() hits the connection's built-in prepared-statement
+    # cache, which persists across calls now that connections are pooled
+    return conn.execute(
+        "SELECT id, name, email, age FROM users WHERE id = ?",
+        (user_id,)).fetchone()
 
 #### Fetch user by ID with automatic connection handling
 user = get_user_by_id(user_id=1)
-print(user)
+# sqlite3.Row has no useful repr; convert for display
+print(tuple(user) if user is not None else None)
@@ -1,23 +1,96 @@
 import time
+import os
+import queue
+import random
 import sqlite3
 import functools
 
+# Tuned per-connection PRAGMAs applied on every open; journal_mode=WAL is
+# issued only on the first open per process since WAL persists in the file.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+_wal_enabled = False
+
+def _configure(conn):
+    """Apply the tuned SQLite PRAGMAs to a freshly opened connection."""
+    global _wal_enabled
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+
+class ConnectionPool:
+    """Small thread-safe pool of pre-opened SQLite connections.
+
+    Keeping connections alive across calls preserves their page cache and
+    avoids paying file-open and setup costs on every query.
+    """
+
+    def __init__(self, db_name='users.db', size=None):
+        self.db_name = db_name
+        self.size = size or int(os.environ.get('DB_POOL_SIZE', '4'))
+        self._connections = queue.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            # Larger prepared-statement LRU (default 128), worthwhile now
+            # that connections live for the whole process; isolation_level
+            # None leaves transaction control to SQLite's autocommit
+            conn = sqlite3.connect(db_name, check_same_thread=False,
+                                   cached_statements=512,
+                                   isolation_level=None)
+            _configure(conn)
+            # Named column access; metadata is shared across rows instead
+            # of building a dict per row
+            conn.row_factory = sqlite3.Row
+            self._connections.put(conn)
+
+    def acquire(self):
+        """Check a connection out of the pool (blocks while all are in use)."""
+        return self._connections.get()
+
+    def release(self, conn):
+        """Return a connection to the pool."""
+        self._connections.put(conn)
+
+# Module-level pool shared by every decorated function
+_pool = ConnectionPool()
+
 def with_db_connection(func):
     """Decorator to handle database connection."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Open a database connection
-        conn = sqlite3.connect('users.db')
+        # Borrow a pooled connection instead of opening a fresh one
+        conn = _pool.acquire()
         try:
             # Call the original function with the connection
             return func(conn, *args, **kwargs)
         finally:
-            # Ensure the connection is closed after the function call
-            conn.close()
+            # Return the connection to the pool for reuse
+            _pool.release(conn)
     return wrapper
 
-def retry_on_failure(retries=3, delay=2):
-    """Decorator to retry a function if it raises an exception."""
+# Message fragments that identify transient lock contention in SQLite
+_RETRYABLE_MESSAGES = ("database is locked", "database is busy")
+
+def _is_retryable(error):
+    """Return True when the error is transient contention worth retrying."""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    message = str(error).lower()
+    return any(fragment in message for fragment in _RETRYABLE_MESSAGES)
+
+def retry_on_failure(retries=3, base_delay=1.0, max_delay=30.0, jitter=0.5):
+    """Decorator to retry transient database failures with backoff.
+
+    Only lock/busy contention (sqlite3.OperationalError) is retried;
+    unrecoverable errors such as integrity or programming errors re-raise
+    immediately. The delay doubles per attempt, scaled by random jitter to
+    avoid retry stampedes and capped at max_delay.
+    """
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
@@ -25,25 +98,31 @@ def retry_on_failure(retries=3, delay=2):
                 try:
                     return func(*args, **kwargs)
                 except Exception as e:
-                    if attempt < retries - 1:  # Check if there are more retries left
-                        print(f"Attempt {attempt + 1} failed: {e}. Retrying in {delay} seconds...")
-                        time.sleep(delay)
-                    else:
+                    if not _is_retryable(e):
+                        raise  # Unrecoverable: retrying would just waste time
+                    if attempt == retries - 1:
                         print(f"All {retries} attempts failed.")
                         raise  # Re-raise the last exception
+                    delay = min(max_delay,
+                                base_delay * (2 ** attempt)
+                                * (1 + random.random() * jitter))
+                    print(f"Attempt {attempt + 1} failed: {e}. "
+                          f"Retrying in {delay:.2f} seconds...")
+                    time.sleep(delay)
         return wrapper
     return decorator
 
 @with_db_connection
-@retry_on_failure(retries=3, delay=1)
+@retry_on_failure(retries=3, base_delay=1)
 def fetch_users_with_retry(conn):
-    cursor = conn.cursor()
-    cursor.execute("SELECT * FROM users")
-    return cursor.fetchall()
+    # conn.execute() hits the connection's built-in prepared-statement
+    # cache, which persists across calls now that connections are pooled
+    return conn.execute("SELECT id, name, email, age FROM users").fetchall()
 
 #### Attempt to fetch users with automatic retry on failure
 try:
     users = fetch_users_with_retry()
-    print(users)
+    # sqlite3.Row has no useful repr; convert for display
+    print([tuple(user) for user in users])
 except Exception as e:
     print(f"Failed to fetch users: {e}")
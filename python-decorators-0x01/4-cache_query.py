@@ -1,52 +1,142 @@
 import time
+import os
+import queue
 import sqlite3
 import functools
+import threading
+import collections
 
-# Global dictionary to cache query results
-query_cache = {}
+# Tuned per-connection PRAGMAs applied on every open; journal_mode=WAL is
+# issued only on the first open per process since WAL persists in the file.
+_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-64000",
+    "PRAGMA mmap_size=268435456",
+)
+_wal_enabled = False
+
+def _configure(conn):
+    """Apply the tuned SQLite PRAGMAs to a freshly opened connection."""
+    global _wal_enabled
+    if not _wal_enabled:
+        conn.execute("PRAGMA journal_mode=WAL")
+        _wal_enabled = True
+    for pragma in _PRAGMAS:
+        conn.execute(pragma)
+
+# Bounded LRU cache of query results keyed by the full call signature,
+# with a TTL so long-running processes neither grow without limit nor
+# serve stale rows forever
+query_cache = collections.OrderedDict()
+CACHE_MAX_ENTRIES = 1024
+CACHE_TTL_SECONDS = 300
+_cache_lock = threading.Lock()
+
+class ConnectionPool:
+    """Small thread-safe pool of pre-opened SQLite connections.
+
+    Keeping connections alive across calls preserves their page cache and
+    avoids paying file-open and setup costs on every query.
+    """
+
+    def __init__(self, db_name='users.db', size=None):
+        self.db_name = db_name
+        self.size = size or int(os.environ.get('DB_POOL_SIZE', '4'))
+        self._connections = queue.Queue(maxsize=self.size)
+        for _ in range(self.size):
+            # Larger prepared-statement LRU (default 128), worthwhile now
+            # that connections live for the whole process; isolation_level
+            # None leaves transaction control to SQLite's autocommit
+            conn = sqlite3.connect(db_name, check_same_thread=False,
+                                   cached_statements=512,
+                                   isolation_level=None)
+            _configure(conn)
+            # Named column access; metadata is shared across rows instead
+            # of building a dict per row
+            conn.row_factory = sqlite3.Row
+            self._connections.put(conn)
+
+    def acquire(self):
+        """Check a connection out of the pool (blocks while all are in use)."""
+        return self._connections.get()
+
+    def release(self, conn):
+        """Return a connection to the pool."""
+        self._connections.put(conn)
+
+# Module-level pool shared by every decorated function
+_pool = ConnectionPool()
 
 def with_db_connection(func):
     """Decorator to handle database connection."""
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        # Open a database connection
-        conn = sqlite3.connect('users.db')
+        # Borrow a pooled connection instead of opening a fresh one
+        conn = _pool.acquire()
         try:
             # Call the original function with the connection
             return func(conn, *args, **kwargs)
         finally:
-            # Ensure the connection is closed after the function call
-            conn.close()
+            # Return the connection to the pool for reuse
+            _pool.release(conn)
     return wrapper
 
 def cache_query(func):
-    """Decorator to cache query results based on the SQL query string."""
+    """Decorator to cache query results keyed on the query and its parameters.
+
+    Hits refresh the entry's LRU position; entries older than
+    CACHE_TTL_SECONDS are treated as misses, and the least recently used
+    entry is evicted once CACHE_MAX_ENTRIES is exceeded. Access is guarded
+    by a lock so the cache stays consistent across pool threads.
+    """
     @functools.wraps(func)
     def wrapper(conn, query, *args, **kwargs):
-        # Check if the query result is already cached
-        if query in query_cache:
-            print("Using cached result for query:", query)
-            return query_cache[query]
-        
+        # Freeze the parameters into a hashable key up front; the common
+        # positional-only call skips the kwargs sort and its allocations
+        if kwargs:
+            key = (query, args, tuple(sorted(kwargs.items())))
+        else:
+            key = (query, args)
+        now = time.monotonic()
+
+        # Check if a fresh result for this exact call is already cached
+        with _cache_lock:
+            entry = query_cache.get(key)
+            if entry is not None:
+                result, stored_at = entry
+                if now - stored_at < CACHE_TTL_SECONDS:
+                    query_cache.move_to_end(key)
+                    print("Using cached result for query:", query)
+                    return result
+                del query_cache[key]  # Expired
+
         # If not cached, call the original function
         result = func(conn, query, *args, **kwargs)
-        
-        # Cache the result
-        query_cache[query] = result
+
+        # Cache the result and evict the least recently used overflow
+        with _cache_lock:
+            query_cache[key] = (result, now)
+            query_cache.move_to_end(key)
+            while len(query_cache) > CACHE_MAX_ENTRIES:
+                query_cache.popitem(last=False)
         return result
     return wrapper
 
 @with_db_connection
 @cache_query
 def fetch_users_with_cache(conn, query):
-    cursor = conn.cursor()
-    cursor.execute(query)
-    return cursor.fetchall()
+    # conn.execute() hits the connection's built-in prepared-statement
+    # cache, which persists across calls now that connections are pooled
+    return conn.execute(query).fetchall()
 
 #### First call will cache the result
-users = fetch_users_with_cache(query="SELECT * FROM users")
-print("First call results:", users)
+users = fetch_users_with_cache(
+    query="SELECT id, name, email, age FROM users")
+# sqlite3.Row has no useful repr; convert for display
+print("First call results:", [tuple(user) for user in users])
 
 #### Second call will use the cached result
-users_again = fetch_users_with_cache(query="SELECT * FROM users")
-print("Second call results:", users_again)
+users_again = fetch_users_with_cache(
+    query="SELECT id, name, email, age FROM users")
+print("Second call results:", [tuple(user) for user in users_again])